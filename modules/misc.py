@@ -56,6 +56,47 @@ class Misc(commands.Cog):
         self.task = self.bot.loop.create_task(self.presences())
         self.extra_user_bots = []
         self.extra_user_bots_ids = [int(i) for i in bot.config['ADDITIONAL_BOT_IDS'].split() if i.isdigit()]
+        self.process = psutil.Process(getpid())
+        self.versions_info = f"> **Versão do Python:** `{platform.python_version()}`\n" \
+                             f"> **Versão do Disnake:** `{disnake.__version__}`\n"
+        self.avatar_cache = {}
+        self.fetched_users = {}
+
+    def get_avatar_url(self, user: disnake.User):
+
+        key = user.avatar.key if user.avatar else None
+
+        try:
+            cached_key, url = self.avatar_cache[user.id]
+            if cached_key == key:
+                return url
+        except KeyError:
+            pass
+
+        url = (user.avatar or user.default_avatar).with_static_format("png").url
+        self.avatar_cache[user.id] = (key, url)
+        return url
+
+    async def fetch_user_cached(self, user_id: int):
+
+        now = disnake.utils.utcnow()
+
+        try:
+            user, expires = self.fetched_users[user_id]
+            if expires > now:
+                return user
+            del self.fetched_users[user_id]
+        except KeyError:
+            pass
+
+        if len(self.fetched_users) > 200:
+            for k, (_, e) in list(self.fetched_users.items()):
+                if e <= now:
+                    del self.fetched_users[k]
+
+        user = await self.bot.fetch_user(user_id)
+        self.fetched_users[user_id] = (user, now + datetime.timedelta(minutes=10))
+        return user
 
     def placeholders(self, text: str):
 
@@ -383,7 +424,7 @@ class Misc(commands.Cog):
         if not bot:
             return
 
-        ram_usage = humanize.naturalsize(psutil.Process(getpid()).memory_info().rss)
+        ram_usage = humanize.naturalsize(self.process.memory_info().rss)
 
         guild = bot.get_guild(inter.guild_id) or inter.guild
 
@@ -468,9 +509,8 @@ class Misc(commands.Cog):
         if bot.pool.commit:
             embed.description += f"> **Commit atual:** [`{bot.pool.commit[:7]}`]({bot.pool.remote_git_url}/commit/{bot.pool.commit})\n"
 
-        embed.description += f"> **Versão do Python:** `{platform.python_version()}`\n" \
-                             f"> **Versão do Disnake:** `{disnake.__version__}`\n" \
-                             f"> **Latencia:** `{round(bot.latency * 1000)}ms`\n" \
+        embed.description += self.versions_info + \
+                             f"> **Latencia:** `{bot.latency * 1000:.0f}ms`\n" \
                              f"> **Uso de RAM:** `{ram_usage}`\n" \
                              f"> **Uptime:** <t:{int(bot.uptime.timestamp())}:R>\n"
 
@@ -508,13 +548,8 @@ class Misc(commands.Cog):
         except AttributeError:
             owner = bot.appinfo.owner
 
-        try:
-            avatar = owner.avatar.with_static_format("png").url
-        except AttributeError:
-            avatar = owner.default_avatar.with_static_format("png").url
-
         embed.set_footer(
-            icon_url=avatar,
+            icon_url=self.get_avatar_url(owner),
             text=f"Dono(a): {owner} [{owner.id}]"
         )
 
@@ -631,26 +666,29 @@ class Misc(commands.Cog):
 
         embeds = []
 
-        assets = {}
+        assets = []
 
         if self.bot.intents.members:
-            user = (await self.bot.fetch_user(inter.target.id) if not inter.target.bot else self.bot.get_user(inter.target.id))
+            user = (await self.fetch_user_cached(inter.target.id) if not inter.target.bot else self.bot.get_user(inter.target.id))
         else:
             user = inter.target
 
         try:
             if inter.target.guild_avatar:
-                assets["Avatar (Server)"] = inter.target.guild_avatar.with_static_format("png")
+                assets.append(("Avatar (Server)", inter.target.guild_avatar))
         except AttributeError:
             pass
-        assets["Avatar (User)"] = user.display_avatar.with_static_format("png")
+        # o avatar vem do payload da interação (sempre atualizado), o user do cache é usado apenas pro banner.
+        assets.append(("Avatar (User)", inter.target.avatar or inter.target.default_avatar))
         if user.banner:
-            assets["Banner"] = user.banner.with_static_format("png")
+            assets.append(("Banner", user.banner))
+
+        color = self.bot.get_color(inter.guild.me if inter.guild else None)
 
-        for name, asset in assets.items():
-            embed = disnake.Embed(description=f"{inter.target.mention} **[{name}]({asset.with_size(2048).url})**",
-                                  color=self.bot.get_color(inter.guild.me if inter.guild else None))
-            embed.set_image(asset.with_size(256).url)
+        for name, asset in assets:
+            embed = disnake.Embed(description=f"{inter.target.mention} **[{name}]({asset.replace(size=2048, static_format='png').url})**",
+                                  color=color)
+            embed.set_image(asset.replace(size=256, static_format="png").url)
             embeds.append(embed)
 
         await inter.send(embeds=embeds, ephemeral=True)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import datetime
 import json
 import logging
@@ -10,6 +11,8 @@ import subprocess
 import traceback
 from configparser import ConfigParser
 from importlib import import_module
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
 from subprocess import check_output
 from typing import Optional, Union, List
 
@@ -45,6 +48,7 @@ class BotPool:
         self.ws_client: Optional[WSClient] = None
         self.spotify: Optional[SpotifyClient] = None
         self.lavalink_instance: Optional[subprocess.Popen] = None
+        self.log_listener: Optional[QueueListener] = None
         self.config = {}
         self.commit = ""
         self.remote_git_url = ""
@@ -196,7 +200,20 @@ class BotPool:
             logger.setLevel(logging.DEBUG)
             handler = logging.FileHandler(filename='./.logs/disnake.log', encoding='utf-8', mode='w')
             handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s %(message)s'))
-            logger.addHandler(handler)
+
+        else:
+            # sem o logger habilitado os erros do rpc continuam indo pro stderr, porém fora do event loop.
+            logger = logging.getLogger("web_app")
+            logger.propagate = False
+            handler = logging.StreamHandler()
+
+        # a escrita dos logs é feita em uma thread separada para não bloquear o event loop.
+        log_queue = Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        self.log_listener = QueueListener(log_queue, handler)
+        self.log_listener.start()
+        # finalizar o listener antes do logging.shutdown() para que os logs pendentes na fila sejam gravados.
+        atexit.register(self.log_listener.stop)
 
         LAVALINK_SERVERS = {}
 
@@ -567,6 +584,8 @@ class BotCore(commands.Bot):
         super().__init__(*args, **kwargs)
         self.music = music_mode(self)
         self.interaction_id: Optional[int] = None
+        self.rpc_bot_info_key: Optional[tuple] = None
+        self.rpc_bot_info_cache: dict = {}
 
         for i in self.config["OWNER_IDS"].split("||"):
 
@@ -616,6 +635,23 @@ class BotCore(commands.Bot):
     def ws_client(self):
         return self.pool.ws_client
 
+    @property
+    def rpc_bot_info(self) -> dict:
+
+        # só é reconstruído quando o avatar, o nome do bot ou a config de auth mudar.
+        key = (self.user.display_avatar.key, str(self.user), self.config["ENABLE_RPC_AUTH"])
+
+        if self.rpc_bot_info_key != key:
+            self.rpc_bot_info_cache = {
+                "bot_id": self.user.id,
+                "bot_name": key[1],
+                "thumb": self.user.display_avatar.replace(size=512, static_format="png").url,
+                "auth_enabled": key[2]
+            }
+            self.rpc_bot_info_key = key
+
+        return self.rpc_bot_info_cache
+
     async def get_data(self, id_: int, *, db_name: Union[DBModel.guilds, DBModel.users]):
         return await self.pool.database.get_data(
             id_=id_, db_name=db_name, collection=str(self.user.id)
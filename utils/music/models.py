@@ -1563,19 +1563,13 @@ class LavalinkPlayer(wavelink.Player):
                     # TODO: Investigar possível bug ao mover o bot de canal pelo discord.
                     return
 
-            thumb = self.bot.user.display_avatar.replace(
-                size=512, static_format="png").url
-
             users = [u for u in users if u != self.bot.user.id]
 
             if close:
 
                 stats = {
                     "op": "close",
-                    "bot_id": self.bot.user.id,
-                    "bot_name": str(self.bot.user),
-                    "thumb": thumb,
-                    "auth_enabled": self.bot.config["ENABLE_RPC_AUTH"]
+                    **self.bot.rpc_bot_info
                 }
 
                 if wait:
@@ -1594,10 +1588,7 @@ class LavalinkPlayer(wavelink.Player):
             stats = {
                 "op": "update",
                 "track": None,
-                "bot_id": self.bot.user.id,
-                "bot_name": str(self.bot.user),
-                "thumb": thumb,
-                "auth_enabled": self.bot.config["ENABLE_RPC_AUTH"],
+                **self.bot.rpc_bot_info,
                 "listen_along_invite": self.listen_along_invite
             }
 
@@ -4,9 +4,9 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
 from os import environ
-from traceback import print_exc
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 import aiohttp
 import disnake
@@ -17,16 +17,33 @@ from packaging import version
 
 from config_loader import load_config
 
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 if TYPE_CHECKING:
     from utils.client import BotPool
 
 logging.getLogger('tornado.access').disabled = True
 
+logger = logging.getLogger(__name__)
+
 users_ws = {}
 bots_ws = []
 
 minimal_version = version.parse("2.6.1")
 
+RPC_BACKOFF_BASE = 7
+RPC_BACKOFF_CAP = 60
+
+WS_TEXT = aiohttp.WSMsgType.TEXT
+# send_frame (aiohttp 3.11+) permite enviar o json já serializado em bytes sem converter para str.
+WS_SEND_FRAME = hasattr(aiohttp.ClientWebSocketResponse, "send_frame")
+
 class IndexHandler(tornado.web.RequestHandler):
 
     def initialize(self, pool: Optional[BotPool] = None, message: str = "", config: dict = None):
@@ -147,7 +164,7 @@ class WebSocketHandler(tornado.websocket.WebSocketHandler):
 
     def on_message(self, message):
 
-        data = json.loads(message)
+        data = json_loads(message)
 
         ws_id = data.get("user_ids")
         bot_id = data.get("bot_id")
@@ -159,7 +176,7 @@ class WebSocketHandler(tornado.websocket.WebSocketHandler):
 
             if not bot_id:
                 print(f"desconectando: por falta de id de usuario {self.request.remote_ip}\nDados: {data}")
-                self.write_message(json.dumps({"op": "disconnect", "reason": "Desconectando por falta de ids de usuario"}))
+                self.write_message(json_dumps({"op": "disconnect", "reason": "Desconectando por falta de ids de usuario"}))
                 self.close(code=4200)
                 return
 
@@ -188,7 +205,7 @@ class WebSocketHandler(tornado.websocket.WebSocketHandler):
                     else:
                         users_ws[data["user"]].blocked = False
 
-                users_ws[data["user"]].write_message(json.dumps(data))
+                users_ws[data["user"]].write_message(json_dumps(data))
 
             except KeyError:
                 pass
@@ -206,19 +223,19 @@ class WebSocketHandler(tornado.websocket.WebSocketHandler):
             return
 
         if app_version < minimal_version:
-            self.write_message(json.dumps({"op": "disconnect", "reason": "Versão do app não suportado! Certifique-se de que está usando "
+            self.write_message(json_dumps({"op": "disconnect", "reason": "Versão do app não suportado! Certifique-se de que está usando "
                                          f"a versão mais recente do app ({minimal_version} ou superior)."}))
             self.close(code=4200)
             return
 
         if len(ws_id) > 3:
-            self.write_message(json.dumps({"op": "disconnect", "reason": "Você está tentando conectar mais de 3 usuários consecutivamente..."}))
+            self.write_message(json_dumps({"op": "disconnect", "reason": "Você está tentando conectar mais de 3 usuários consecutivamente..."}))
             self.close(code=4200)
             return
 
         if len(token) not in (0, 50):
             self.write_message(
-                json.dumps({"op": "disconnect", "reason": f"O token precisa ter 50 caracteres..."}))
+                json_dumps({"op": "disconnect", "reason": f"O token precisa ter 50 caracteres..."}))
             self.close(code=4200)
             return
 
@@ -228,7 +245,7 @@ class WebSocketHandler(tornado.websocket.WebSocketHandler):
 
         for u_id in ws_id:
             try:
-                users_ws[u_id].write_message(json.dumps({"op": "disconnect",
+                users_ws[u_id].write_message(json_dumps({"op": "disconnect",
                                                "reason": "Nova sessão iniciada em outro local..."}))
                 users_ws[u_id].close(code=4200)
             except:
@@ -240,7 +257,7 @@ class WebSocketHandler(tornado.websocket.WebSocketHandler):
         for w in bots_ws:
 
             try:
-                w.write_message(json.dumps(data))
+                w.write_message(json_dumps(data))
             except Exception as e:
                 print(f"Erro ao processar dados do rpc para os bot's {w.bot_ids}: {repr(e)}")
 
@@ -287,10 +304,16 @@ class WSClient:
         self.url: str = url
         self.pool = pool
         self.connection = None
-        self.backoff: int = 7
+        self.backoff: float = RPC_BACKOFF_BASE
         self.data: dict = {}
         self.session: Optional[aiohttp.ClientSession] = None
         self.connect_task = []
+        self.tasks: set = set()
+        self.pending_rpc_users: set = set()
+        self.rpc_flush_handle: Optional[asyncio.TimerHandle] = None
+        self.op_handlers = {
+            "rpc_update": self.rpc_update,
+        }
 
     async def connect(self):
 
@@ -299,12 +322,23 @@ class WSClient:
 
         self.connection = await self.session.ws_connect(self.url, heartbeat=30)
 
-        self.backoff = 7
+        self.backoff = RPC_BACKOFF_BASE
 
         print("RPC client conectado, sincronizando rpc dos bots...")
 
         self.connect_task = [asyncio.create_task(self.connect_bot_rpc())]
 
+    def next_backoff(self, base: int = RPC_BACKOFF_BASE, cap: int = RPC_BACKOFF_CAP):
+        # decorrelated jitter: evita que vários bots tentem reconectar exatamente no mesmo intervalo.
+        return min(cap, random.uniform(base, self.backoff * 3))
+
+    def create_task(self, coro) -> asyncio.Task:
+        # manter uma referência das tasks até finalizarem pra evitar que sejam coletadas pelo gc.
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
     @property
     def is_connected(self):
         return self.connection and not self.connection.closed
@@ -326,13 +360,18 @@ class WSClient:
         await asyncio.sleep(1)
 
         for bot in self.pool.bots:
-            for player in bot.music.players.values():
+            # cópia da lista de players caso algum seja criado/removido durante o await.
+            for player in list(bot.music.players.values()):
 
-                if not player.guild.me.voice:
+                voice = player.guild.me.voice
+
+                if not voice:
                     continue
 
-                if player.guild.me.voice.channel.voice_states:
-                    bot.loop.create_task(player.process_rpc(player.last_channel))
+                if voice.channel.voice_states:
+                    # sem o wait o process_rpc não chega a aguardar nada (o envio fica em uma task do próprio
+                    # player), então pode ser executado diretamente sem criar uma task por player.
+                    await player.process_rpc(player.last_channel)
 
         print(f"[RPC client] - Os dados de rpc foram sincronizados com sucesso.")
 
@@ -342,22 +381,92 @@ class WSClient:
             return
 
         try:
-            await self.connection.send_json(data)
-        except:
-            print_exc()
+            payload = json_dumps(data)
+            if WS_SEND_FRAME:
+                await self.connection.send_frame(payload, WS_TEXT)
+            else:
+                await self.connection.send_str(payload.decode())
+        except Exception:
+            logger.exception("Falha ao enviar dados para o servidor RPC")
+
+    def process_data(self, raw: Union[str, bytes]):
+
+        data = json_loads(raw)
+
+        try:
+            handler = self.op_handlers[data.get("op")]
+        except KeyError:
+            return
+
+        users: list = data.get("user_ids")
+
+        if not users:
+            return
+
+        # converter os ids apenas uma vez aqui, os handlers já recebem um set de ints.
+        try:
+            users = {int(u) for u in users}
+        except (TypeError, ValueError):
+            return
+
+        handler(users)
+
+    def rpc_update(self, users: set):
+
+        # agrupar os rpc_update recebidos em um curto intervalo para processar todos de uma vez.
+        self.pending_rpc_users.update(users)
+
+        if not self.rpc_flush_handle:
+            self.rpc_flush_handle = asyncio.get_running_loop().call_later(0.25, self.flush_rpc_update)
+
+    def flush_rpc_update(self):
+
+        self.rpc_flush_handle = None
+        users = self.pending_rpc_users
+        self.pending_rpc_users = set()
+
+        targets = []
+
+        for bot in self.pool.bots:
+            for player in bot.music.players.values():
+                voice = player.guild.me.voice
+                if not voice:
+                    continue
+                vc = voice.channel
+                vc_user_ids = [i for i in vc.voice_states if i in users]
+                if vc_user_ids:
+                    targets.append((player, vc))
+                    users.difference_update(vc_user_ids)
+
+        if targets:
+            self.create_task(self.update_players_rpc(targets))
+
+    async def update_players_rpc(self, targets: list):
+
+        # sem o wait o process_rpc não chega a aguardar nada (o envio fica em uma task do próprio player),
+        # então todos os players podem ser processados em uma única task.
+        for player, vc in targets:
+            await player.process_rpc(vc)
 
     def clear_tasks(self):
 
         for t in self.connect_task:
-            try:
-                t.cancel()
-            except:
-                continue
+            t.cancel()
 
         self.connect_task.clear()
 
+        # o connect_bot_rpc já sincroniza todos os players após reconectar.
+        if self.rpc_flush_handle:
+            self.rpc_flush_handle.cancel()
+            self.rpc_flush_handle = None
+
+        self.pending_rpc_users.clear()
+
     async def ws_loop(self):
 
+        process_data = self.process_data
+        op_names = tuple(self.op_handlers)
+
         while True:
 
             try:
@@ -373,10 +482,24 @@ class WSClient:
                     print(f"Conexão com servidor RPC perdida - Reconectando em {int(self.backoff)} segundo(s).")
 
                 await asyncio.sleep(self.backoff)
-                self.backoff *= 2.5
+                self.backoff = self.next_backoff()
                 continue
 
-            message = await self.connection.receive()
+            # a conexão só muda após sair deste loop, então o receive pode ficar em uma variável local.
+            receive = self.connection.receive
+
+            while True:
+
+                message = await receive()
+
+                if message.type != WS_TEXT:
+                    break
+
+                data = message.data
+
+                # descartar frames que não possuem nenhuma op conhecida sem decodificar o json.
+                if any(op in data for op in op_names):
+                    process_data(data)
 
             if message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
                 print(f"RPC Websocket Closed: {message.extra}\nReconnecting in {self.backoff}s")
@@ -387,27 +510,8 @@ class WSClient:
                 print(f"RPC Websocket Finalizado: {message.extra}")
                 return
 
-            data = json.loads(message.data)
-
-            users: list = data.get("user_ids")
-
-            if not users:
-                continue
-
-            op = data.get("op")
-
-            if op == "rpc_update":
-
-                for bot in self.pool.bots:
-                    for player in bot.music.players.values():
-                        if not player.guild.me.voice:
-                            continue
-                        vc = player.guild.me.voice.channel
-                        vc_user_ids = [i for i in vc.voice_states if i in users]
-                        if vc_user_ids:
-                            bot.loop.create_task(player.process_rpc(vc))
-                            for i in vc_user_ids:
-                                users.remove(i)
+            elif message.type == aiohttp.WSMsgType.BINARY:
+                process_data(message.data)
 
 
 def run_app(pool: BotPool, message: str = "", config: dict = None):